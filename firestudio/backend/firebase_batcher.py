@@ -0,0 +1,68 @@
+import time
+
+import httpx
+import orjson
+
+# Flush whenever the buffer holds this many readings or gets this old,
+# whichever comes first
+FLUSH_MAX_SAMPLES = 50
+FLUSH_MAX_AGE_SECONDS = 0.5
+
+
+class FirebaseBatcher:
+    """
+    Coalesce sensor writes into a single Firebase PATCH per batch.
+
+    One PUT per reading pays a full round trip each time; Firebase's REST
+    API accepts a multi-path PATCH, so buffering readings keyed by their
+    database path (e.g. "sensor/<device_id>") and flushing them together
+    cuts the request count by the batch size.
+    """
+
+    def __init__(self, database_url, auth_token=None,
+                 max_samples=FLUSH_MAX_SAMPLES, max_age=FLUSH_MAX_AGE_SECONDS):
+        self._base_url = database_url.rstrip('/')
+        self._auth_token = auth_token
+        self._max_samples = max_samples
+        self._max_age = max_age
+        self._buffer = {}
+        self._last_flush = time.monotonic()
+        # Single HTTP/2 client so every flush reuses one connection
+        self._client = httpx.AsyncClient(http2=True)
+
+    def add(self, key, payload):
+        """Buffer a reading under its database path, flushing if due"""
+        self._buffer[key] = payload
+
+    def flush_due(self):
+        """Whether the buffer is full or stale enough to flush"""
+        if not self._buffer:
+            return False
+        return (len(self._buffer) >= self._max_samples
+                or time.monotonic() - self._last_flush >= self._max_age)
+
+    async def add_and_maybe_flush(self, key, payload):
+        self.add(key, payload)
+        if self.flush_due():
+            await self.flush()
+
+    async def flush(self):
+        """Send all buffered readings in one PATCH"""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, {}
+        url = f"{self._base_url}/.json"
+        if self._auth_token:
+            url += f"?auth={self._auth_token}"
+        response = await self._client.patch(
+            url,
+            content=orjson.dumps(batch),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+    async def aclose(self):
+        """Flush any pending readings and close the client"""
+        await self.flush()
+        await self._client.aclose()
@@ -1,72 +1,116 @@
 import logging
+import orjson
 import structlog
 from prometheus_client import Counter, Histogram, Gauge, start_http_server
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 
 # Prometheus metrics
-REQUEST_COUNT = Counter('agriassist_requests_total', 'Total requests', ['method', 'endpoint'])
-REQUEST_DURATION = Histogram('agriassist_request_duration_seconds', 'Request duration')
+REQUEST_COUNT = Counter('agriassist_requests_total', 'Total requests', ['endpoint'])
+# Explicit buckets tailored to API latencies we actually chart; fewer
+# buckets means fewer series per scrape than the 11-bucket default
+REQUEST_DURATION = Histogram(
+    'agriassist_request_duration_seconds',
+    'Request duration',
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
 ACTIVE_CONNECTIONS = Gauge('agriassist_active_connections', 'Active connections')
 SENSOR_DATA_COUNT = Counter('agriassist_sensor_data_total', 'Total sensor data points')
 MODEL_PREDICTIONS = Counter('agriassist_model_predictions_total', 'ML model predictions', ['model_type'])
 
-# Configure structured logging
+# Pre-bound label children for the model types we ship, so hot paths call
+# .inc() directly instead of paying a labels() lookup per prediction.
+# Adding a model type means registering it here -- deliberate, it keeps
+# label cardinality under review.
+_MODEL_PREDICTION_CHILDREN = {
+    model_type: MODEL_PREDICTIONS.labels(model_type=model_type)
+    for model_type in ("disease", "crop_recommendation", "fertilizer")
+}
+
+# Configure structured logging. orjson renders log lines as bytes, so
+# pair it with BytesLoggerFactory to skip the decode/re-encode round trip.
+# The default chain skips StackInfoRenderer/format_exc_info -- they probe
+# every record for stack_info/exc_info and only error records carry them,
+# so those processors live on the dedicated error logger below.
+INFO_PROCESSORS = [
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.JSONRenderer(serializer=orjson.dumps),
+]
+
+ERROR_PROCESSORS = [
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.JSONRenderer(serializer=orjson.dumps),
+]
+
 structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
-    ],
+    processors=INFO_PROCESSORS,
     context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
+    logger_factory=structlog.BytesLoggerFactory(),
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger()
 
+# Error logger with the full stack/exc_info chain, for failure paths only
+error_logger = structlog.wrap_logger(
+    structlog.BytesLogger(),
+    processors=ERROR_PROCESSORS,
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+)
+
 def monitor_endpoint(endpoint_name):
     """Decorator for monitoring API endpoints"""
     def decorator(func):
+        # Resolve label children and the endpoint-bound logger once per
+        # decoration, not per call
+        request_count = REQUEST_COUNT.labels(endpoint=endpoint_name)
+        request_duration = REQUEST_DURATION
+        ep_logger = logger.bind(endpoint=endpoint_name)
+        ep_error_logger = error_logger.bind(endpoint=endpoint_name)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            REQUEST_COUNT.labels(method='POST', endpoint=endpoint_name).inc()
-            
+            start_time = time.perf_counter()
+            request_count.inc()
+            error = None
+
             try:
                 result = await func(*args, **kwargs)
-                logger.info(
-                    "API request completed",
-                    endpoint=endpoint_name,
-                    duration=time.time() - start_time,
-                    status="success"
-                )
                 return result
             except Exception as e:
-                logger.error(
-                    "API request failed",
-                    endpoint=endpoint_name,
-                    duration=time.time() - start_time,
-                    error=str(e),
-                    status="error"
-                )
+                error = e
                 raise
             finally:
-                REQUEST_DURATION.observe(time.time() - start_time)
-        
+                # Read the clock once and reuse the duration everywhere
+                duration = time.perf_counter() - start_time
+                request_duration.observe(duration)
+                if error is None:
+                    # DEBUG so the filtering bound logger drops it for
+                    # free in production; failures stay at ERROR
+                    ep_logger.debug(
+                        "API request completed",
+                        duration=duration,
+                        status="success"
+                    )
+                else:
+                    ep_error_logger.error(
+                        "API request failed",
+                        duration=duration,
+                        error=str(error),
+                        status="error"
+                    )
+
         return wrapper
     return decorator
 
 def log_sensor_data(device_id: str, data_type: str):
     """Log sensor data collection"""
-    SENSOR_DATA_COUNT.labels().inc()
+    SENSOR_DATA_COUNT.inc()
     logger.info(
         "Sensor data received",
         device_id=device_id,
@@ -76,7 +120,10 @@ def log_sensor_data(device_id: str, data_type: str):
 
 def log_ml_prediction(model_type: str, confidence: float):
     """Log ML model predictions"""
-    MODEL_PREDICTIONS.labels(model_type=model_type).inc()
+    child = _MODEL_PREDICTION_CHILDREN.get(model_type)
+    if child is None:
+        child = MODEL_PREDICTIONS.labels(model_type=model_type)
+    child.inc()
     logger.info(
         "ML prediction made",
         model_type=model_type,
@@ -84,10 +131,15 @@ def log_ml_prediction(model_type: str, confidence: float):
         timestamp=time.time()
     )
 
-# Start Prometheus metrics server
+# Start Prometheus metrics server. lru_cache makes this a process-level
+# singleton: repeated calls (re-imports, app factories) won't spawn a
+# second exporter thread or fail rebinding the port. Under gunicorn with
+# workers > 1, use prometheus_client.multiprocess.MultiProcessCollector
+# with PROMETHEUS_MULTIPROC_DIR instead of one exporter per worker.
+@lru_cache(maxsize=1)
 def start_metrics_server(port=9090):
     start_http_server(port)
-    logger.info(f"Metrics server started on port {port}")
+    logger.info("Metrics server started", port=port)
 
 # Health check function
 async def health_check():
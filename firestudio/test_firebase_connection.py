@@ -1,5 +1,9 @@
+import orjson
 import requests
-import json
+
+# One session for the whole script so the write and read reuse the same
+# TCP/TLS connection instead of handshaking twice
+session = requests.Session()
 
 # Simple test to verify Firebase Realtime Database connection
 def test_firebase_connection():
@@ -27,7 +31,13 @@ def test_firebase_connection():
     try:
         # Write test data
         print("📤 Writing test data to Firebase...")
-        response = requests.put(url, json=test_data)
+        # Pre-serialize with orjson instead of letting requests run
+        # stdlib json.dumps under the hood
+        response = session.put(
+            url,
+            data=orjson.dumps(test_data),
+            headers={"Content-Type": "application/json"},
+        )
         
         if response.status_code == 200:
             print("✅ Write successful!")
@@ -39,12 +49,12 @@ def test_firebase_connection():
         
         # Read test data
         print("📥 Reading data from Firebase...")
-        response = requests.get(url)
+        response = session.get(url)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("✅ Read successful!")
-            print(f"   Data: {json.dumps(data, indent=2)}")
+            print(f"   Data: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}")
             return True
         else:
             print(f"❌ Read failed with status {response.status_code}")